@@ -3,10 +3,12 @@ import logging
 
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
 from json import dumps as json_dumps, load as json_load
-from random import seed as random_seed, random as random_random, uniform as random_uniform, choice as random_choice
-from math import tau, pi, cos as mcos, sin as msin, pow as mpow, sqrt as msqrt, floor as mfloor
+from math import tau, pi, floor as mfloor, ceil as mceil
 from os.path import join as path_join
 from os import makedirs as os_makedirs
+from itertools import product
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Requires module "cairocffi"
 # PYPI: https://pypi.python.org/pypi/cairocffi
@@ -14,6 +16,24 @@ from os import makedirs as os_makedirs
 # Install with: pip3 install cairocffi
 import cairocffi as cairo
 
+# Requires module "numpy"
+# PYPI: https://pypi.python.org/pypi/numpy
+# DOCS: https://numpy.org/doc/stable/
+# Install with: pip3 install numpy
+import numpy as np
+
+# Optional module "numba", compiles the point generators when available
+# PYPI: https://pypi.python.org/pypi/numba
+# DOCS: https://numba.readthedocs.io/en/stable/
+# Install with: pip3 install numba
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+    def njit(*_args, **_kwargs):
+        return lambda func: func
+
 # INFO:
 # * Arc is clockwise from horizonal
 
@@ -24,6 +44,12 @@ def register(func):
     REGISTERED_FUNCTIONS[func.__name__] = func
     return func
 
+# Patterns taking an "rng" argument, rendering passes each one a generator seeded from --seed
+RANDOM_FUNCTIONS = set()
+def register_random(func):
+    RANDOM_FUNCTIONS.add(func.__name__)
+    return register(func)
+
 # TODO:
 # * https://en.wikipedia.org/wiki/Ammann%E2%80%93Beenker_tiling
 # * https://en.wikipedia.org/wiki/Anisohedral_tiling
@@ -38,60 +64,292 @@ def register(func):
 # * https://en.wikipedia.org/wiki/Self-tiling_tile_set
 # * https://en.wikipedia.org/wiki/Wang_tile
 
-def frange(start, end, step):
-    if start < end:
-        while start < end:
-            yield start
-            start += step
-    elif start > end:
-        while start > end:
-            yield start
-            start += step
+def _grid(resolution):
+    # Tile origins across [-1,1), computed in one call rather than by accumulating floats
+    return np.arange(-1, 1, resolution).tolist()
+
+def _seed_rng(seed):
+    # A generator seeded from the bytes of the seed string, unlike hash() this is the same in every process
+    return np.random.default_rng(int.from_bytes(seed.encode(), 'little'))
+
+def _unit_vectors(angles):
+    # The cosines and sines of an array of angles, each evaluated in one vectorized call rather than per angle
+    return np.cos(angles).tolist(), np.sin(angles).tolist()
+
+def _path_data(path):
+    # Lay out a path, as returned by copy_path, as cairo_path_data_t elements in an (N, 2) float64 array. Each 16 byte
+    # element is either a (type, length) int header or an (x, y) point; the mask marks the points.
+    number = sum(1 + len(coordinates) // 2 for _, coordinates in path)
+    data = np.zeros((number, 2))
+    is_point = np.zeros(number, dtype=bool)
+    headers = data.view(np.int32)
+    n = 0
+    for path_type, coordinates in path:
+        headers[n, :2] = (path_type, 1 + len(coordinates) // 2)
+        for i in range(0, len(coordinates), 2):
+            n += 1
+            data[n] = coordinates[i:i + 2]
+            is_point[n] = True
+        n += 1
+    return data, is_point
+
+def _append_path_data(draw, data):
+    # Append path data laid out by _path_data to the current path with one cairo call. The buffer must stay referenced
+    # until cairo has copied the path.
+    path_data = cairo.ffi.from_buffer('cairo_path_data_t[]', data)
+    path = cairo.ffi.new('cairo_path_t *', {'status': cairo.STATUS_SUCCESS, 'data': path_data, 'num_data': len(data)})
+    cairo.cairo.cairo_append_path(draw._pointer, path)  # pylint: disable=protected-access
+
+def _polyline_data(points):
+    # Path data, as laid out by _path_data, moving to the first point and drawing lines through the rest
+    data = np.zeros((2 * len(points), 2))
+    data[1::2] = points
+    headers = data.view(np.int32)
+    headers[0::2, :2] = (cairo.PATH_LINE_TO, 2)
+    headers[0, 0] = cairo.PATH_MOVE_TO
+    return data
+
+def _tile_templates(draw, builders):
+    # Trace each tile, drawn relative to an origin of (0, 0), once so it can be stamped across the grid
+    templates = []
+    for build in builders:
+        draw.new_path()
+        build()
+        templates.append(_path_data(draw.copy_path()))
+    draw.new_path()
+    return templates
+
+def _append_tiles(draw, templates, selections, x_origins, y_origins):
+    # Stamp the selected template at every tile origin and append the lot as a single path. Tiles are grouped by
+    # template, which doesn't change the result of the fill or stroke.
+    tiles = []
+    for n, (data, is_point) in enumerate(templates):
+        chosen = selections == n
+        offsets = np.stack((x_origins[chosen], y_origins[chosen]), axis=-1)
+        stamped = data + offsets[:, None, :] * is_point[:, None]
+        # Restore the headers exactly, they aren't really floats
+        stamped.view(np.int32)[:, ~is_point] = data.view(np.int32)[~is_point]
+        tiles.append(stamped.reshape(-1, 2))
+    _append_path_data(draw, np.concatenate(tiles))
+
+def polar_to_xy(radius, angles):
+    # Points at the given radius (or radii) and angles, evaluated for the whole array at once and returned as a list
+    return list(zip((radius * np.cos(angles)).tolist(), (radius * np.sin(angles)).tolist()))
+
+@njit(cache=True)
+def _fast_sincos(angles):
+    # Cosines and sines accurate to ~4e-6, plenty for rasterizing, from degree 7 polynomials on [-pi/4,pi/4]
+    quadrant = np.rint(angles * (2.0 / pi))
+    x = angles - quadrant * (pi / 2.0)
+    x2 = x * x
+    sines = x * (1.0 + x2 * (-1.0 / 6.0 + x2 * (1.0 / 120.0 - x2 * (1.0 / 5040.0))))
+    cosines = 1.0 + x2 * (-0.5 + x2 * (1.0 / 24.0 - x2 * (1.0 / 720.0)))
+
+    # Fold the quadrant back in by swapping and negating
+    q = quadrant.astype(np.int64) & 3
+    swap = (q & 1) == 1
+    sines, cosines = np.where(swap, cosines, sines), np.where(swap, sines, cosines)
+    sines = np.where(q >= 2, -sines, sines)
+    cosines = np.where((q == 1) | (q == 2), -cosines, cosines)
+    return cosines, sines
+
+@njit(cache=True)
+def _archimedean_points(amplitude, max_angle, iterations):
+    angles = np.arange(iterations) * (max_angle / iterations)
+    r = amplitude * angles
+    cosines, sines = _fast_sincos(angles)
+    points = np.empty((iterations, 2))
+    points[:, 0] = r * cosines
+    points[:, 1] = r * sines
+    return points
+
+@lru_cache(maxsize=None)
+def _archimedean_spiral_data(anti_clockwise, loops, line_width, iterations):
+    # The path only depends on the shape of the spiral so is shared by every spiral drawn with the same parameters
+    max_angle = loops * tau
+
+    # Adjust the amplitude so that a thick line doesn't clip
+    a = (1.0 - (line_width / 2.0)) / max_angle
+    if anti_clockwise:
+        a = -a
+
+    # Move to the centre then draw a line through every point
+    data = _polyline_data(np.vstack(((0.0, 0.0), _archimedean_points(a, max_angle, iterations))))
+    data.flags.writeable = False
+    return data
+
+@njit(cache=True)
+def _theodorean_triangles(resolution, number):
+    # The outer corner of the nth triangle is at radius resolution * sqrt(n + 1), turned atan(1 / sqrt(n)) from the
+    # previous corner, so the triangles come straight from a cumulative sum of angles rather than a recurrence
+    k = np.arange(1, number + 1)
+    angles = np.cumsum(np.arctan(1.0 / np.sqrt(k)))
+    radii = resolution * np.sqrt(k + 1.0)
+    triangles = np.empty((number, 4))
+    triangles[:, 2] = radii * np.cos(angles)
+    triangles[:, 3] = radii * np.sin(angles)
+    triangles[0, 0] = resolution
+    triangles[0, 1] = 0.0
+    triangles[1:, 0] = triangles[:-1, 2]
+    triangles[1:, 1] = triangles[:-1, 3]
+    return triangles
+
+@njit(cache=True)
+def _archimedean_block_angles(inner_radius, amplitude, block_max_width, max_angle):
+    # Each block steps the angle on by the widest block at its radius, a recurrence with no exact closed form. The
+    # steps are at least the widest block at the outermost radius, which bounds their number.
+    angles = np.empty(int(max_angle * (inner_radius + amplitude * max_angle) / block_max_width) + 2)
+    angle = 0.0
+    n = 0
+    while angle < max_angle:
+        angles[n] = angle
+        radius = inner_radius + amplitude * angle
+        angle += tau / (tau * radius / block_max_width)
+        n += 1
+    return angles[:n]
+
+@njit(cache=True, fastmath=True)
+def _triangle_points(vertices, choices, x_start, y_start, proportion):
+    # The chaos game, each point is part way from the last towards the chosen vertex
+    points = np.empty((len(choices), 2))
+    x, y = x_start, y_start
+    for i, choice in enumerate(choices):
+        x = (vertices[choice, 0] + x) * proportion
+        y = (vertices[choice, 1] + y) * proportion
+        points[i, 0] = x
+        points[i, 1] = y
+    return points
+
+@njit(cache=True, fastmath=True)
+def _fern_points(choices, x_start, y_start):
+    # https://en.wikipedia.org/wiki/Barnsley_fern, each choice in [0,1) picks one of the four affine maps
+    points = np.empty((len(choices), 2))
+    x, y = x_start, y_start
+    for i, choice in enumerate(choices):
+        if choice < 0.01:
+            x, y = 0.0, 0.16 * y
+        elif choice < 0.86:
+            x, y = 0.85 * x + 0.04 * y, -0.04 * x + 0.85 * y + 1.6
+        elif choice < 0.93:
+            x, y = 0.2 * x - 0.26 * y, 0.23 * x + 0.22 * y + 1.6
+        else:
+            x, y = -0.15 * x + 0.28 * y, 0.26 * x + 0.24 * y + 0.44
+        points[i, 0] = x
+        points[i, 1] = y
+    return points
+
+def _transparencies(draw):
+    # One transparency per device pixel, multiplied down by each dot splatted onto it
+    target = draw.get_target()
+    return np.ones((target.get_height(), target.get_width()))
+
+@njit(cache=True)
+def _dot_coverage_scale(radius):
+    # The ramp over a dot's edge overestimates its area, this scales the coverage down to cover the dot's own area
+    area = radius * radius + 1.0 / 12.0 if radius >= 0.5 else (radius + 0.5) ** 3 / 3.0
+    return radius * radius / area
+
+@njit(cache=True, fastmath=True)
+def _splat_dot_kernel(transparencies, x_points, y_points, radius):
+    # Each dot covers a pixel by how far the pixel centre lies inside its edge, written straight into the pixels so
+    # memory doesn't depend on the number or size of the dots
+    scale = _dot_coverage_scale(radius)
+    reach = int(np.ceil(radius + 0.5))
+    height, width = transparencies.shape
+    for x_point, y_point in zip(x_points, y_points):
+        column, row = int(np.floor(x_point)), int(np.floor(y_point))
+        for r in range(max(row - reach, 0), min(row + reach + 1, height)):
+            for c in range(max(column - reach, 0), min(column + reach + 1, width)):
+                coverage = radius + 0.5 - np.sqrt((c + 0.5 - x_point) ** 2 + (r + 0.5 - y_point) ** 2)
+                if coverage > 0:
+                    transparencies[r, c] *= 1.0 - min(coverage, 1.0) * scale
+
+# Elements in each of the (dots, rows, columns) arrays built by _splat_dots_numpy
+_SPLAT_ELEMENTS = 1 << 20
+
+def _splat_dots_numpy(transparencies, x_points, y_points, radius):
+    # The same splat as _splat_dot_kernel for when numba isn't available, a pure python loop would be far slower than
+    # cairo. Vectorized over as many dots at a time as keeps the arrays to _SPLAT_ELEMENTS, whatever the radius.
+    offsets = np.arange(-mceil(radius + 0.5), mceil(radius + 0.5) + 1)
+    chunk = max(1, _SPLAT_ELEMENTS // len(offsets) ** 2)
+    height, width = transparencies.shape
+    for start in range(0, len(x_points), chunk):
+        x_chunk = x_points[start:start + chunk, None, None]
+        y_chunk = y_points[start:start + chunk, None, None]
+        columns = np.floor(x_chunk).astype(int) + offsets[None, None, :]
+        rows = np.floor(y_chunk).astype(int) + offsets[None, :, None]
+        coverage = np.clip(radius + 0.5 - np.hypot(columns + 0.5 - x_chunk, rows + 0.5 - y_chunk), 0, 1) * \
+            _dot_coverage_scale(radius)
+        columns, rows = np.broadcast_arrays(columns, rows)
+        inside = (coverage > 0) & (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+        np.multiply.at(transparencies, (rows[inside], columns[inside]), 1 - coverage[inside])
+
+def _splat_dots(draw, transparencies, points, radius):
+    # Accumulate antialiased dots of the user space radius, centred on the points, into the pixel transparencies, as
+    # cairo filling one dot after another would but without a path and fill for every dot. Only approximates cairo's
+    # antialiasing.
+    xx, yx, xy, yy, x0, y0 = draw.get_matrix().as_tuple()
+    x_points = points[:, 0] * xx + points[:, 1] * xy + x0
+    y_points = points[:, 0] * yx + points[:, 1] * yy + y0
+    splat = _splat_dot_kernel if _HAVE_NUMBA else _splat_dots_numpy
+    splat(transparencies, x_points, y_points, radius * np.sqrt(abs(xx * yy - xy * yx)))
+
+def _paint_transparencies(draw, transparencies):
+    # Paint the current source through the splatted dots in one go
+    height, width = transparencies.shape
+    stride = cairo.ImageSurface.format_stride_for_width(cairo.FORMAT_A8, width)
+    alphas = np.zeros((height, stride), dtype=np.uint8)
+    alphas[:, :width] = np.rint((1 - transparencies) * 255)
+    mask = cairo.ImageSurface.create_for_data(alphas, cairo.FORMAT_A8, width, height, stride)
+    draw.save()
+    draw.identity_matrix()
+    draw.mask_surface(mask, 0, 0)
+    draw.restore()
+
+def _is_greyscale(draw):
+    # Patterns are drawn onto A8 surfaces, where the alpha channel holds the grey and is written out as a greyscale PNG
+    return draw.get_target().get_format() == cairo.FORMAT_A8
+
+def _set_grey(draw, grey):
+    if _is_greyscale(draw):
+        draw.set_source_rgba(0, 0, 0, grey)
+    else:
+        draw.set_source_rgb(grey, grey, grey)
 
-def polar_to_xy(radius, angle):
-    return radius * mcos(angle), radius * msin(angle)
+def _grey_setter(draw):
+    # For patterns setting a grey per shape, checks the surface format once rather than on every call
+    if _is_greyscale(draw):
+        set_source_rgba = draw.set_source_rgba
+        return lambda grey: set_source_rgba(0, 0, 0, grey)
+    set_source_rgb = draw.set_source_rgb
+    return lambda grey: set_source_rgb(grey, grey, grey)
+
+# White at the centre fading to black at the unit circle, created once and shared by every pattern
+_CENTRE_GRADIENT = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
+_CENTRE_GRADIENT.add_color_stop_rgb(0, 1, 1, 1)
+_CENTRE_GRADIENT.add_color_stop_rgb(1, 0, 0, 0)
+_CENTRE_GRADIENT_A8 = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
+_CENTRE_GRADIENT_A8.add_color_stop_rgba(0, 0, 0, 0, 1)
+_CENTRE_GRADIENT_A8.add_color_stop_rgba(1, 0, 0, 0, 0)
+
+def _set_centre_gradient(draw):
+    draw.set_source(_CENTRE_GRADIENT_A8 if _is_greyscale(draw) else _CENTRE_GRADIENT)
 
 def _draw_centre_gradient(draw):
-    radial_gradient = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
-    radial_gradient.add_color_stop_rgb(0, 1, 1, 1)
-    radial_gradient.add_color_stop_rgb(1, 0, 0, 0)
-    draw.set_source(radial_gradient)
+    _set_centre_gradient(draw)
     draw.rectangle(-1, -1, 2, 2)
     draw.fill()
 
-def _draw_centre_discrete(draw, steps=10):
-    for r in frange(1, 0, -1.0 / steps):
-        draw.arc(0, 0, r, 0, tau)
-        grey = 1 - r
-        draw.set_source_rgb(grey, grey, grey)
-        draw.fill()
-
 #######################################################################################################################
 
 @register
 def archimedean_spiral(draw, anti_clockwise=False, radial=True, loops=5, line_width=0.05, iterations=10000):
-    max_angle = loops * tau
-    step_angle = max_angle / iterations
-
-    # Adjust the amplitude so that a thick line doesn't clip
-    a = (1.0 - (line_width / 2.0)) / max_angle
-    if anti_clockwise:
-        a = -a
-
-    draw.move_to(0, 0)
-    for angle in frange(0, max_angle, step_angle):
-        r = a * angle
-        x = r * mcos(angle)
-        y = r * msin(angle)
-        draw.line_to(x, y)
+    _append_path_data(draw, _archimedean_spiral_data(anti_clockwise, loops, line_width, iterations))
 
     if radial:
-        radial_gradient = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
-        radial_gradient.add_color_stop_rgb(0, 1, 1, 1)
-        radial_gradient.add_color_stop_rgb(1, 0, 0, 0)
-        draw.set_source(radial_gradient)
+        _set_centre_gradient(draw)
     else:
-        draw.set_source_rgb(1, 1, 1)
+        _set_grey(draw, 1)
     draw.set_line_width(line_width)
     draw.set_line_cap(cairo.LINE_CAP_ROUND)
     draw.stroke()
@@ -104,22 +362,21 @@ def archimedean_double_spiral(draw, **kwargs):
 @register
 def theodorean_spiral(draw, resolution=0.1, number=111):
     # https://en.wikipedia.org/wiki/Spiral_of_Theodorus
-    triangles = [(resolution, 0, resolution, resolution)]
-    for _ in range(1, number):
-        lx, ly = triangles[-1][2], triangles[-1][3]
-        nx, ny = -ly, lx
-        l = msqrt(nx * nx + ny * ny)
-        triangles.append((lx, ly, lx + resolution * (nx / l), ly + resolution * (ny / l)))
-
-    grey = 1.0 / number
-    for ax, ay, bx, by in reversed(triangles):
-        draw.move_to(0, 0)
-        draw.line_to(ax, ay)
-        draw.line_to(bx, by)
-        draw.line_to(0, 0)
-        draw.set_source_rgb(grey, grey, grey)
-        draw.fill()
-        grey += 1.0 / number
+    triangles = _theodorean_triangles(resolution, number)
+
+    # The outermost triangle is drawn first and darkest, each grey counted rather than accumulated
+    greys = (np.arange(1, number + 1) / number).tolist()
+    move_to = draw.move_to
+    line_to = draw.line_to
+    set_grey = _grey_setter(draw)
+    fill = draw.fill
+    for (ax, ay, bx, by), grey in zip(reversed(triangles.tolist()), greys):
+        move_to(0, 0)
+        line_to(ax, ay)
+        line_to(bx, by)
+        line_to(0, 0)
+        set_grey(grey)
+        fill()
 
 @register
 def triple_spiral():
@@ -135,252 +392,331 @@ def borjgalo():
 def radials(draw, spokes=16, line_width=0.05, truncate=0):
     _draw_centre_gradient(draw)
     radius = 1.0 - line_width
-    for angle in frange(0, tau, tau / spokes):
-        x_vec = mcos(angle)
-        y_vec = msin(angle)
-        draw.move_to(truncate * x_vec, truncate * y_vec)
-        draw.line_to(radius * x_vec, radius * y_vec)
+    move_to = draw.move_to
+    line_to = draw.line_to
+    for x_vec, y_vec in zip(*_unit_vectors(np.arange(spokes) * (tau / spokes))):
+        move_to(truncate * x_vec, truncate * y_vec)
+        line_to(radius * x_vec, radius * y_vec)
 
-    draw.set_source_rgb(0, 0, 0)
+    _set_grey(draw, 0)
     draw.set_line_width(line_width)
     draw.set_line_cap(cairo.LINE_CAP_SQUARE)
     draw.stroke()
 
-@register
-def random_spots(draw, iterations=1000, max_size=0.1, min_size=0.01, random=True):
-    bubbles = []
-    while len(bubbles) < iterations:
-        x1, y1, r1 = random_uniform(-1, 1), random_uniform(-1, 1), random_uniform(min_size, max_size)
-        for x2, y2, r2 in bubbles:
-            if msqrt(mpow((x2 - x1), 2) + mpow((y2 - y1), 2)) < (r1 + r2):
-                # Intersection
-                break
-        else:
-            bubbles.append((x1, y1, r1))
-
-    for x, y, r in bubbles:
-        draw.arc(x, y, r, 0, tau)
-        if random:
-            grey = random_random()
-        else:
-            grey = 1.0 - (r / (max_size - min_size))
-        draw.set_source_rgb(grey, grey, grey)
-        draw.fill()
-
-@register
-def truchet_triangles(draw, resolution=0.1):
+# Proposals tested against the spots at a time
+_SPOTS_BATCH = 256
+# The smallest cell width of the table _place_spots buckets the spots into, a 32nd of the canvas
+_MIN_SPOT_CELL = 2.0 / 32
+_NEIGHBOURS = np.array(list(product((-1, 0, 1), repeat=2))).T
+
+def _accept_spots(spots, table, candidates, candidate_cells):
+    # Test the candidates against the spots in their neighbouring cells in one go. The survivors may still intersect
+    # each other, where they do only the first accepted survives. Returns the indices of the accepted candidates.
+    x_points, y_points, radii = candidates
+    near = table[candidate_cells[0][:, None] + _NEIGHBOURS[0], candidate_cells[1][:, None] + _NEIGHBOURS[1]]
+    near = near.reshape(len(radii), -1)
+    x_spots, y_spots, r_spots = spots
+    clear = ~(np.square(x_spots[near] - x_points[:, None]) + np.square(y_spots[near] - y_points[:, None]) <
+              np.square(r_spots[near] + radii[:, None])).any(axis=1)
+
+    x_points, y_points, radii = x_points[clear], y_points[clear], radii[clear]
+    earlier = np.tril(np.square(x_points[:, None] - x_points) + np.square(y_points[:, None] - y_points) <
+                      np.square(radii[:, None] + radii), k=-1)
+    keep = np.ones(len(radii), dtype=bool)
+    for i in np.flatnonzero(earlier.any(axis=1)).tolist():
+        keep[i] = not (earlier[i] & keep).any()
+    return np.flatnonzero(clear)[keep]
+
+def _add_to_table(table, counts, cells, indices):
+    # Record each spot's index in its cell, doubling the depth of the table whenever a cell fills
+    for i, cell_x, cell_y in zip(indices, *cells.tolist()):
+        if counts[cell_x, cell_y] == table.shape[2]:
+            table = np.concatenate((table, np.full_like(table, -1)), axis=2)
+        table[cell_x, cell_y, counts[cell_x, cell_y]] = i
+        counts[cell_x, cell_y] += 1
+    return table
+
+def _place_spots(rng, iterations, min_size, max_size):
+    # Bucket the spots into a grid of cells wide enough that any intersecting spot is in a neighbouring cell, with a
+    # margin of empty cells around the edge. Each cell holds the indices of its spots, padded with -1 for the last spot
+    # which is at infinity so can't be hit. Wider cells only admit more candidates, so that the table doesn't grow with
+    # tiny spots the cells are no smaller than _MIN_SPOT_CELL. Returns the rows of x, y and radius of each spot.
+    cell = max(2.0 * max_size, _MIN_SPOT_CELL)
+    cells = int(2.0 / cell) + 3
+    spots = np.zeros((3, iterations + 1))
+    spots[:2] = np.inf
+    table = np.full((cells, cells, 1), -1)
+    counts = np.zeros((cells, cells), dtype=int)
+    n = 0
+    while n < iterations:
+        candidates = rng.uniform((-1, -1, min_size), (1, 1, max_size), size=(_SPOTS_BATCH, 3)).T
+        candidate_cells = ((candidates[:2] + 1) / cell).astype(int) + 1
+        accepted = _accept_spots(spots, table, candidates, candidate_cells)[:iterations - n]
+        spots[:, n:n + len(accepted)] = candidates[:, accepted]
+        table = _add_to_table(table, counts, candidate_cells[:, accepted], range(n, n + len(accepted)))
+        n += len(accepted)
+    return spots[:, :iterations]
+
+@register_random
+def random_spots(draw, iterations=1000, max_size=0.1, min_size=0.01, random=True, rng=None):
+    # Patterns draw from the generator they're given, default_rng passes a generator straight through
+    rng = np.random.default_rng(rng)
+    spots = _place_spots(rng, iterations, min_size, max_size)
+
+    if random:
+        greys = rng.random(iterations).tolist()
+    else:
+        greys = (1.0 - (spots[2] / (max_size - min_size))).tolist()
+    arc = draw.arc
+    set_grey = _grey_setter(draw)
+    fill = draw.fill
+    for x, y, r, grey in zip(*spots.tolist(), greys):
+        arc(x, y, r, 0, tau)
+        set_grey(grey)
+        fill()
+
+@register_random
+def truchet_triangles(draw, resolution=0.1, rng=None):
     # https://en.wikipedia.org/wiki/Truchet_tiles
-    orientations = [1, 2, 3, 4]
+    rng = np.random.default_rng(rng)
     r = resolution
-    for x in frange(-1, 1, r):
-        for y in frange(-1, 1, r):
-            selection = random_choice(orientations)
-            if selection == 1:
-                draw.move_to(x, y)
-                draw.line_to(x, y + r)
-                draw.line_to(x + r, y)
-                draw.line_to(x, y)
-            elif selection == 2:
-                draw.move_to(x + r, y)
-                draw.line_to(x + r, y + r)
-                draw.line_to(x, y)
-                draw.line_to(x + r, y)
-            elif selection == 3:
-                draw.move_to(x + r, y + r)
-                draw.line_to(x, y + r)
-                draw.line_to(x + r, y)
-                draw.line_to(x + r, y + r)
-            elif selection == 4:
-                draw.move_to(x, y + r)
-                draw.line_to(x, y)
-                draw.line_to(x + r, y + r)
-                draw.line_to(x, y + r)
-    draw.set_source_rgb(1, 1, 1)
+    move_to = draw.move_to
+    line_to = draw.line_to
+
+    def tile_1():
+        move_to(0, 0)
+        line_to(0, r)
+        line_to(r, 0)
+        line_to(0, 0)
+
+    def tile_2():
+        move_to(r, 0)
+        line_to(r, r)
+        line_to(0, 0)
+        line_to(r, 0)
+
+    def tile_3():
+        move_to(r, r)
+        line_to(0, r)
+        line_to(r, 0)
+        line_to(r, r)
+
+    def tile_4():
+        move_to(0, r)
+        line_to(0, 0)
+        line_to(r, r)
+        line_to(0, r)
+
+    orientations = _tile_templates(draw, (tile_1, tile_2, tile_3, tile_4))
+    xs, ys = np.meshgrid(_grid(r), _grid(r), indexing='ij')
+    selections = rng.integers(len(orientations), size=xs.shape)
+    _append_tiles(draw, orientations, selections, xs, ys)
+    _set_grey(draw, 1)
     draw.fill()
 
-@register
-def truchet_quarter_cirlces(draw, resolution=0.1, line_width=0.025):
+@register_random
+def truchet_quarter_cirlces(draw, resolution=0.1, line_width=0.025, rng=None):
     # https://en.wikipedia.org/wiki/Truchet_tiles
-    orientations = [1, 2]
+    rng = np.random.default_rng(rng)
     r = resolution / 2.0
-    for x in frange(-1, 1, resolution):
-        for y in frange(-1, 1, resolution):
-            selection = random_choice(orientations)
-            if selection == 1:
-                draw.new_sub_path()
-                draw.arc(x, y, r, 0, pi / 2.0)
-                draw.new_sub_path()
-                draw.arc(x + resolution, y + resolution, r, pi, pi * 3.0 / 2.0)
-            elif selection == 2:
-                draw.new_sub_path()
-                draw.arc(x + resolution, y, r, pi / 2.0, pi)
-                draw.new_sub_path()
-                draw.arc(x, y + resolution, r, pi * 3.0 / 2.0, tau)
-    draw.set_source_rgb(1, 1, 1)
+    arc = draw.arc
+    new_sub_path = draw.new_sub_path
+
+    def tile_1():
+        new_sub_path()
+        arc(0, 0, r, 0, pi / 2.0)
+        new_sub_path()
+        arc(resolution, resolution, r, pi, pi * 3.0 / 2.0)
+
+    def tile_2():
+        new_sub_path()
+        arc(resolution, 0, r, pi / 2.0, pi)
+        new_sub_path()
+        arc(0, resolution, r, pi * 3.0 / 2.0, tau)
+
+    orientations = _tile_templates(draw, (tile_1, tile_2))
+    xs, ys = np.meshgrid(_grid(resolution), _grid(resolution), indexing='ij')
+    selections = rng.integers(len(orientations), size=xs.shape)
+    _append_tiles(draw, orientations, selections, xs, ys)
+    _set_grey(draw, 1)
     draw.set_line_width(line_width)
     draw.stroke()
 
-@register
-def truchet_diagonals(draw, resolution=0.1, line_width=0.05):
+@register_random
+def truchet_diagonals(draw, resolution=0.1, line_width=0.05, rng=None):
     # https://en.wikipedia.org/wiki/Truchet_tiles
-    orientations = [1, 2]
+    rng = np.random.default_rng(rng)
     r = resolution
-    for x in frange(-1, 1, r):
-        for y in frange(-1, 1, r):
-            selection = random_choice(orientations)
-            if selection == 1:
-                draw.move_to(x, y)
-                draw.line_to(x + r, y + r)
-            elif selection == 2:
-                draw.move_to(x + r, y)
-                draw.line_to(x, y + r)
-    draw.set_source_rgb(1, 1, 1)
+    move_to = draw.move_to
+    line_to = draw.line_to
+
+    def tile_1():
+        move_to(0, 0)
+        line_to(r, r)
+
+    def tile_2():
+        move_to(r, 0)
+        line_to(0, r)
+
+    orientations = _tile_templates(draw, (tile_1, tile_2))
+    xs, ys = np.meshgrid(_grid(r), _grid(r), indexing='ij')
+    selections = rng.integers(len(orientations), size=xs.shape)
+    _append_tiles(draw, orientations, selections, xs, ys)
+    _set_grey(draw, 1)
     draw.set_line_width(line_width)
     draw.set_line_cap(cairo.LINE_CAP_ROUND)
     draw.stroke()
 
-@register
-def truchet_variation(draw, resolution=0.1, line_width=0.015):
-    # https://en.wikipedia.org/wiki/Truchet_tiles
-    orientations = [1, 2, 3, 4, 5, 6, 7]
+def _truchet_variation_templates(draw, resolution):
+    # The seven tiles, each joining the midpoints of its edges with quarter circles or straight lines
     r = resolution / 2.0
-    for x in frange(-1, 1, resolution):
-        for y in frange(-1, 1, resolution):
-            selection = random_choice(orientations)
-            if selection == 1:
-                draw.new_sub_path()
-                draw.arc(x, y, r, 0, pi / 2.0)
-                draw.new_sub_path()
-                draw.arc(x + resolution, y + resolution, r, pi, pi * 3.0 / 2.0)
-            elif selection == 2:
-                draw.new_sub_path()
-                draw.arc(x, y, r, 0, pi / 2.0)
-                draw.move_to(x + r, y + resolution)
-                draw.line_to(x + r, y + r)
-                draw.line_to(x + resolution, y + r)
-            elif selection == 3:
-                draw.new_sub_path()
-                draw.arc(x + resolution, y + resolution, r, pi, pi * 3.0 / 2.0)
-                draw.move_to(x + r, y)
-                draw.line_to(x + r, y + r)
-                draw.line_to(x, y + r)
-            elif selection == 4:
-                draw.new_sub_path()
-                draw.arc(x + resolution, y, r, pi / 2.0, pi)
-                draw.new_sub_path()
-                draw.arc(x, y + resolution, r, pi * 3.0 / 2.0, tau)
-            elif selection == 5:
-                draw.new_sub_path()
-                draw.arc(x + resolution, y, r, pi / 2.0, pi)
-                draw.move_to(x, y + r)
-                draw.line_to(x + r, y + r)
-                draw.line_to(x + r, y + resolution)
-            elif selection == 6:
-                draw.new_sub_path()
-                draw.arc(x, y + resolution, r, pi * 3.0 / 2.0, tau)
-                draw.move_to(x + r, y)
-                draw.line_to(x + r, y + r)
-                draw.line_to(x + resolution, y + r)
-            elif selection == 7:
-                draw.move_to(x + r, y)
-                draw.line_to(x + r, y + resolution)
-                draw.move_to(x, y + r)
-                draw.line_to(x + resolution, y + r)
-    draw.set_source_rgb(1, 1, 1)
+    move_to = draw.move_to
+    line_to = draw.line_to
+    arc = draw.arc
+    new_sub_path = draw.new_sub_path
+
+    def tile_1():
+        new_sub_path()
+        arc(0, 0, r, 0, pi / 2.0)
+        new_sub_path()
+        arc(resolution, resolution, r, pi, pi * 3.0 / 2.0)
+
+    def tile_2():
+        new_sub_path()
+        arc(0, 0, r, 0, pi / 2.0)
+        move_to(r, resolution)
+        line_to(r, r)
+        line_to(resolution, r)
+
+    def tile_3():
+        new_sub_path()
+        arc(resolution, resolution, r, pi, pi * 3.0 / 2.0)
+        move_to(r, 0)
+        line_to(r, r)
+        line_to(0, r)
+
+    def tile_4():
+        new_sub_path()
+        arc(resolution, 0, r, pi / 2.0, pi)
+        new_sub_path()
+        arc(0, resolution, r, pi * 3.0 / 2.0, tau)
+
+    def tile_5():
+        new_sub_path()
+        arc(resolution, 0, r, pi / 2.0, pi)
+        move_to(0, r)
+        line_to(r, r)
+        line_to(r, resolution)
+
+    def tile_6():
+        new_sub_path()
+        arc(0, resolution, r, pi * 3.0 / 2.0, tau)
+        move_to(r, 0)
+        line_to(r, r)
+        line_to(resolution, r)
+
+    def tile_7():
+        move_to(r, 0)
+        line_to(r, resolution)
+        move_to(0, r)
+        line_to(resolution, r)
+
+    return _tile_templates(draw, (tile_1, tile_2, tile_3, tile_4, tile_5, tile_6, tile_7))
+
+@register_random
+def truchet_variation(draw, resolution=0.1, line_width=0.015, rng=None):
+    # https://en.wikipedia.org/wiki/Truchet_tiles
+    rng = np.random.default_rng(rng)
+    orientations = _truchet_variation_templates(draw, resolution)
+    xs, ys = np.meshgrid(_grid(resolution), _grid(resolution), indexing='ij')
+    selections = rng.integers(len(orientations), size=xs.shape)
+    _append_tiles(draw, orientations, selections, xs, ys)
+    _set_grey(draw, 1)
     draw.set_line_width(line_width)
     draw.set_line_join(cairo.LINE_JOIN_BEVEL)
     draw.stroke()
 
-@register
-def truchet_12_variation(draw, resolution=0.1, line_width=0.025):
-    # https://en.wikipedia.org/wiki/Truchet_tiles
-    orientations = [1, 2]
-    shapes = [1, 2, 3]
+def _truchet_12_templates(draw, resolution):
+    # Each orientation places one of three shapes in each of two opposite corners, joining the midpoints of the corner's
+    # edges. There is a template for every combination of orientation, first shape and second shape, in that order.
     r = resolution / 2.0
-    for x in frange(-1, 1, resolution):
-        for y in frange(-1, 1, resolution):
-            selection = random_choice(orientations)
-            if selection == 1:
-                # Top left
-                shape = random_choice(shapes)
-                if shape == 1:
-                    draw.new_sub_path()
-                    draw.arc(x, y, r, 0, pi / 2.0)
-                elif shape == 2:
-                    draw.move_to(x + r, y)
-                    draw.line_to(x, y + r)
-                elif shape == 3:
-                    draw.move_to(x + r, y)
-                    draw.line_to(x + r, y + r)
-                    draw.line_to(x, y + r)
-
-                # Bottom right
-                shape = random_choice(shapes)
-                if shape == 1:
-                    draw.new_sub_path()
-                    draw.arc(x + resolution, y + resolution, r, pi, pi * 3.0 / 2.0)
-                elif shape == 2:
-                    draw.move_to(x + r, y + resolution)
-                    draw.line_to(x + resolution, y + r)
-                elif shape == 3:
-                    draw.move_to(x + r, y + resolution)
-                    draw.line_to(x + r, y + r)
-                    draw.line_to(x + resolution, y + r)
-
-            elif selection == 2:
-                # Top right
-                shape = random_choice(shapes)
-                if shape == 1:
-                    draw.new_sub_path()
-                    draw.arc(x + resolution, y, r, pi / 2.0, pi)
-                elif shape == 2:
-                    draw.move_to(x + r, y)
-                    draw.line_to(x + resolution, y + r)
-                elif shape == 3:
-                    draw.move_to(x + r, y)
-                    draw.line_to(x + r, y + r)
-                    draw.line_to(x + resolution, y + r)
-
-                # Bottom left
-                shape = random_choice(shapes)
-                if shape == 1:
-                    draw.new_sub_path()
-                    draw.arc(x, y + resolution, r, pi * 3.0 / 2.0, tau)
-                elif shape == 2:
-                    draw.move_to(x, y + r)
-                    draw.line_to(x + r, y + resolution)
-                elif shape == 3:
-                    draw.move_to(x, y + r)
-                    draw.line_to(x + r, y + r)
-                    draw.line_to(x + r, y + resolution)
-
-    draw.set_source_rgb(1, 1, 1)
+
+    def corner_shapes(corner, start_angle, end_angle, start, end):
+        def quarter_circle():
+            draw.new_sub_path()
+            draw.arc(*corner, r, start_angle, end_angle)
+
+        def diagonal():
+            draw.move_to(*start)
+            draw.line_to(*end)
+
+        def right_angle():
+            draw.move_to(*start)
+            draw.line_to(r, r)
+            draw.line_to(*end)
+
+        return quarter_circle, diagonal, right_angle
+
+    orientations = [
+        (corner_shapes((0, 0), 0, pi / 2.0, (r, 0), (0, r)),
+         corner_shapes((resolution, resolution), pi, pi * 3.0 / 2.0, (r, resolution), (resolution, r))),
+        (corner_shapes((resolution, 0), pi / 2.0, pi, (r, 0), (resolution, r)),
+         corner_shapes((0, resolution), pi * 3.0 / 2.0, tau, (0, r), (r, resolution))),
+    ]
+
+    def combine(first, second):
+        return lambda: (first(), second())
+    return _tile_templates(draw, [combine(first, second)
+                                  for firsts, seconds in orientations for first in firsts for second in seconds])
+
+@register_random
+def truchet_12_variation(draw, resolution=0.1, line_width=0.025, rng=None):
+    # https://en.wikipedia.org/wiki/Truchet_tiles
+    rng = np.random.default_rng(rng)
+    templates = _truchet_12_templates(draw, resolution)
+    shapes = 3
+
+    xs, ys = np.meshgrid(_grid(resolution), _grid(resolution), indexing='ij')
+    selections = rng.integers(len(templates) // (shapes * shapes), size=xs.shape)
+    # The shapes of the two arcs/lines in each tile
+    tile_shapes = rng.integers(shapes, size=xs.shape + (2,))
+    selections = (selections * shapes + tile_shapes[..., 0]) * shapes + tile_shapes[..., 1]
+    _append_tiles(draw, templates, selections, xs, ys)
+    _set_grey(draw, 1)
     draw.set_line_width(line_width)
     draw.set_line_join(cairo.LINE_JOIN_BEVEL)
     draw.set_line_cap(cairo.LINE_CAP_ROUND)
     draw.stroke()
 
-@register
-def truchet_diagonal_strips(draw, resolution=0.1, line_width=0.01):
+@register_random
+def truchet_diagonal_strips(draw, resolution=0.1, line_width=0.01, rng=None):
     # https://en.wikipedia.org/wiki/Truchet_tiles
-    orientations = [1, 2]
+    rng = np.random.default_rng(rng)
     r = resolution
-    for x in frange(-1, 1, r):
-        for y in frange(-1, 1, r):
-            selection = random_choice(orientations)
-            if selection == 1:
-                for s in frange(line_width, resolution, 2.0 * line_width):
-                    draw.move_to(x + s, y)
-                    draw.line_to(x, y + s)
-                    draw.move_to(x + resolution - s, y + resolution)
-                    draw.line_to(x + resolution, y + resolution - s)
-            elif selection == 2:
-                for s in frange(line_width, resolution, 2.0 * line_width):
-                    draw.move_to(x + s, y)
-                    draw.line_to(x + resolution, y + resolution - s)
-                    draw.move_to(x, y + s)
-                    draw.line_to(x + resolution - s, y + resolution)
-    draw.set_source_rgb(1, 1, 1)
+    move_to = draw.move_to
+    line_to = draw.line_to
+    # The strip offsets are the same in every tile
+    strips = np.arange(line_width, resolution, 2.0 * line_width).tolist()
+
+    def tile_1():
+        for s in strips:
+            move_to(s, 0)
+            line_to(0, s)
+            move_to(r - s, r)
+            line_to(r, r - s)
+
+    def tile_2():
+        for s in strips:
+            move_to(s, 0)
+            line_to(r, r - s)
+            move_to(0, s)
+            line_to(r - s, r)
+
+    orientations = _tile_templates(draw, (tile_1, tile_2))
+    xs, ys = np.meshgrid(_grid(r), _grid(r), indexing='ij')
+    selections = rng.integers(len(orientations), size=xs.shape)
+    _append_tiles(draw, orientations, selections, xs, ys)
+    _set_grey(draw, 1)
     draw.set_line_width(line_width)
     draw.set_line_cap(cairo.LINE_CAP_ROUND)
     draw.stroke()
@@ -389,26 +725,29 @@ def truchet_diagonal_strips(draw, resolution=0.1, line_width=0.01):
 def ring_blocks(draw, radial=False, rings=10, ring_depth_rate=0.85, inner_radius=0.4, block_max_width=0.05):
     ring_depth = (1.0 - inner_radius) / rings
     block_depth = ring_depth * ring_depth_rate
+    move_to = draw.move_to
+    line_to = draw.line_to
 
-    for radius in frange(inner_radius, 1.0, ring_depth):
+    for radius in (inner_radius + np.arange(rings) * ring_depth).tolist():
         circumference = tau * radius
         block_per_ring = mfloor(circumference / block_max_width)
         angle_per_block = (tau / block_per_ring) * 0.8
 
-        for angle in frange(0, tau, tau / block_per_ring):
-            draw.move_to(*polar_to_xy(radius, angle))
-            draw.line_to(*polar_to_xy(radius + block_depth, angle))
-            draw.line_to(*polar_to_xy(radius + block_depth, angle + angle_per_block))
-            draw.line_to(*polar_to_xy(radius, angle + angle_per_block))
-            draw.line_to(*polar_to_xy(radius, angle))
+        # The corners of every block in the ring
+        angles = np.arange(block_per_ring) * (tau / block_per_ring)
+        for a, b, c, d in zip(polar_to_xy(radius, angles), polar_to_xy(radius + block_depth, angles),
+                              polar_to_xy(radius + block_depth, angles + angle_per_block),
+                              polar_to_xy(radius, angles + angle_per_block)):
+            move_to(*a)
+            line_to(*b)
+            line_to(*c)
+            line_to(*d)
+            line_to(*a)
 
     if radial:
-        radial_gradient = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
-        radial_gradient.add_color_stop_rgb(0, 1, 1, 1)
-        radial_gradient.add_color_stop_rgb(1, 0, 0, 0)
-        draw.set_source(radial_gradient)
+        _set_centre_gradient(draw)
     else:
-        draw.set_source_rgb(1, 1, 1)
+        _set_grey(draw, 1)
     draw.fill()
 
 @register
@@ -418,35 +757,35 @@ def archimedean_blocks(draw, radial=False, loops=12, ring_depth_rate=0.6, inner_
     ring_depth = (1.0 - inner_radius) / (loops + 1)
     amplitude = ring_depth / tau
     block_depth = ring_depth * ring_depth_rate
-
-    angle = 0.0
-    block_run_counter = 0
-    while angle < loops * tau:
-        # Take current radius to determine the additional block angle
-        radius = inner_radius + amplitude * angle
-        circumference = tau * radius
-        # How many blocks fit into a ring at the current radius?
-        max_angle_step = tau / (circumference / block_max_width)
-        min_angle_step = tau / (circumference / block_min_width)
-        angle_block = (max_angle_step - (max_angle_step - min_angle_step) * \
-            (block_run_counter % blocks_per_run / blocks_per_run)) * 0.9
-
-        draw.move_to(*polar_to_xy(radius, angle))
-        draw.line_to(*polar_to_xy(radius + block_depth, angle))
-        draw.line_to(*polar_to_xy(radius + block_depth, angle + angle_block))
-        draw.line_to(*polar_to_xy(radius, angle + angle_block))
-        draw.line_to(*polar_to_xy(radius, angle))
-
-        angle += max_angle_step
-        block_run_counter += 1
+    move_to = draw.move_to
+    line_to = draw.line_to
+
+    angles = _archimedean_block_angles(inner_radius, amplitude, block_max_width, loops * tau)
+
+    # Take the radius of each block to determine its angle
+    radii = inner_radius + amplitude * angles
+    circumferences = tau * radii
+    # How many blocks fit into a ring at the current radius?
+    max_angle_steps = tau / (circumferences / block_max_width)
+    min_angle_steps = tau / (circumferences / block_min_width)
+    block_run_counters = np.arange(len(angles)) % blocks_per_run
+    angle_blocks = (max_angle_steps - (max_angle_steps - min_angle_steps) * \
+        (block_run_counters / blocks_per_run)) * 0.9
+
+    # The corners of every block
+    for a, b, c, d in zip(polar_to_xy(radii, angles), polar_to_xy(radii + block_depth, angles),
+                          polar_to_xy(radii + block_depth, angles + angle_blocks),
+                          polar_to_xy(radii, angles + angle_blocks)):
+        move_to(*a)
+        line_to(*b)
+        line_to(*c)
+        line_to(*d)
+        line_to(*a)
 
     if radial:
-        radial_gradient = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
-        radial_gradient.add_color_stop_rgb(0, 1, 1, 1)
-        radial_gradient.add_color_stop_rgb(1, 0, 0, 0)
-        draw.set_source(radial_gradient)
+        _set_centre_gradient(draw)
     else:
-        draw.set_source_rgb(1, 1, 1)
+        _set_grey(draw, 1)
     draw.fill()
 
 @register
@@ -454,74 +793,80 @@ def ring_wedges(draw, radial=False, rings=10, ring_depth_rate=0.85, inner_radius
                 point_in=True, alternate=False):
     ring_depth = (1.0 - inner_radius) / rings
     block_depth = ring_depth * ring_depth_rate
+    move_to = draw.move_to
+    line_to = draw.line_to
+
+    # The corners of the wedges around a ring for each arrangement, which is chosen once up front
+    def alternating(radius, angles, angle_per_block):
+        width_angle = angle_per_block * 0.8
+        yield from zip(polar_to_xy(radius, angles + (width_angle * 0.5)),
+                       polar_to_xy(radius + block_depth, angles),
+                       polar_to_xy(radius + block_depth, angles + width_angle))
+
+        angles = angles + (angle_per_block - width_angle) + (width_angle * 0.5)
+        yield from zip(polar_to_xy(radius, angles),
+                       polar_to_xy(radius + block_depth, angles + (width_angle * 0.5)),
+                       polar_to_xy(radius, angles + width_angle))
+
+    def pointing_in(radius, angles, angle_per_block):
+        return zip(polar_to_xy(radius, angles + (angle_per_block * 0.5)),
+                   polar_to_xy(radius + block_depth, angles),
+                   polar_to_xy(radius + block_depth, angles + angle_per_block))
+
+    def pointing_out(radius, angles, angle_per_block):
+        return zip(polar_to_xy(radius, angles),
+                   polar_to_xy(radius + block_depth, angles + (angle_per_block * 0.5)),
+                   polar_to_xy(radius, angles + angle_per_block))
+
+    if alternate:
+        wedges = alternating
+    elif point_in:
+        wedges = pointing_in
+    else:
+        wedges = pointing_out
 
-    for radius in frange(inner_radius, 1.0, ring_depth):
+    for radius in (inner_radius + np.arange(rings) * ring_depth).tolist():
         circumference = tau * radius
         block_per_ring = mfloor(circumference / block_max_width)
         angle_per_block = (tau / block_per_ring) * 0.8
 
-        if alternate:
-            for angle in frange(0, tau, tau / block_per_ring):
-                width_angle = angle_per_block * 0.8
-                draw.move_to(*polar_to_xy(radius, angle + (width_angle * 0.5)))
-                draw.line_to(*polar_to_xy(radius + block_depth, angle))
-                draw.line_to(*polar_to_xy(radius + block_depth, angle + width_angle))
-                draw.line_to(*polar_to_xy(radius, angle + (width_angle * 0.5)))
-
-                angle += (angle_per_block - width_angle) + (width_angle * 0.5)
-                draw.move_to(*polar_to_xy(radius, angle))
-                draw.line_to(*polar_to_xy(radius + block_depth, angle + (width_angle * 0.5)))
-                draw.line_to(*polar_to_xy(radius, angle + width_angle))
-                draw.line_to(*polar_to_xy(radius, angle))
-        else:
-            for angle in frange(0, tau, tau / block_per_ring):
-                if point_in:
-                    draw.move_to(*polar_to_xy(radius, angle + (angle_per_block * 0.5)))
-                    draw.line_to(*polar_to_xy(radius + block_depth, angle))
-                    draw.line_to(*polar_to_xy(radius + block_depth, angle + angle_per_block))
-                    draw.line_to(*polar_to_xy(radius, angle + (angle_per_block * 0.5)))
-                else:
-                    draw.move_to(*polar_to_xy(radius, angle))
-                    draw.line_to(*polar_to_xy(radius + block_depth, angle + (angle_per_block * 0.5)))
-                    draw.line_to(*polar_to_xy(radius, angle + angle_per_block))
-                    draw.line_to(*polar_to_xy(radius, angle))
+        angles = np.arange(block_per_ring) * (tau / block_per_ring)
+        for a, b, c in wedges(radius, angles, angle_per_block):
+            move_to(*a)
+            line_to(*b)
+            line_to(*c)
+            line_to(*a)
 
     if radial:
-        radial_gradient = cairo.RadialGradient(0, 0, 0, 0, 0, 1)
-        radial_gradient.add_color_stop_rgb(0, 1, 1, 1)
-        radial_gradient.add_color_stop_rgb(1, 0, 0, 0)
-        draw.set_source(radial_gradient)
+        _set_centre_gradient(draw)
     else:
-        draw.set_source_rgb(1, 1, 1)
+        _set_grey(draw, 1)
     draw.fill()
 
-@register
-def triangle(draw, iterations=50000, radius=0.002, proportion=0.5):
-    points = [(0, -0.9), (0.9, 0.9), (-0.9, 0.9)]
-    last = (random_random(), random_random())
-    draw.set_source_rgb(1, 1, 1)
-    for _ in range(iterations):
-        direction = random_choice(points)
-        last = ((direction[0] + last[0]) * proportion, (direction[1] + last[1]) * proportion)
-        draw.arc(last[0], last[1], radius, 0, tau)
-        draw.fill()
-
-@register
-def fern(draw, iterations=5000000, radius=0.002, proportion=0.5):
-    last = (0.0, 0.0)
-    draw.set_source_rgb(1, 1, 1)
-    for _ in range(iterations):
-        p = random_random()
-        if p < 0.01:
-            last = (0.0, 0.16 * last[1])
-        elif p < 0.86:
-            last = (0.85 * last[0] + 0.04 * last[1], -0.04 * last[0] + 0.85 * last[1] + 1.6)
-        elif p < 0.93:
-            last = (0.2 * last[0] - 0.26 * last[1], 0.23 * last[0] + 0.22 * last[1] + 1.6)
-        else:
-            last = (-0.15 * last[0] + 0.28 * last[1], 0.26 * last[0] + 0.24 * last[1] + 0.44)
-        draw.arc(last[0], last[1], radius, 0, tau)
-        draw.fill()
+@register_random
+def triangle(draw, iterations=50000, radius=0.002, proportion=0.5, rng=None):
+    rng = np.random.default_rng(rng)
+    vertices = np.array([(0, -0.9), (0.9, 0.9), (-0.9, 0.9)])
+    x, y = rng.random(2).tolist()
+    points = _triangle_points(vertices, rng.integers(len(vertices), size=iterations), x, y, proportion)
+    transparencies = _transparencies(draw)
+    _splat_dots(draw, transparencies, points, radius)
+    _set_grey(draw, 1)
+    _paint_transparencies(draw, transparencies)
+
+@register_random
+def fern(draw, iterations=5000000, radius=0.002, proportion=0.5, rng=None):
+    rng = np.random.default_rng(rng)
+    x, y = 0.0, 0.0
+    transparencies = _transparencies(draw)
+    # Generate and splat the points a chunk at a time, bounding the memory of long runs
+    chunk = 65536
+    for start in range(0, iterations, chunk):
+        points = _fern_points(rng.random(min(chunk, iterations - start)), x, y)
+        _splat_dots(draw, transparencies, points, radius)
+        x, y = points[-1].tolist()
+    _set_grey(draw, 1)
+    _paint_transparencies(draw, transparencies)
 
 #######################################################################################################################
 
@@ -530,6 +875,7 @@ def parse_args():
     parser.add_argument('config', help='Configuration JSON')
     parser.add_argument('--path', help='Output path')
     parser.add_argument('--seed', default='Boundless', help='Generation seed')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes, defaults to the number of CPUs')
     parser.add_argument('-v', '--verbose', action='store_true')
     parser.add_argument('-d', '--debug', action='store_true')
     args = parser.parse_args()
@@ -545,61 +891,102 @@ def parse_args():
 
     return args
 
+# Each process reuses a surface and context, for each size and format, for every pattern it renders
+_CONTEXTS = {}
+
+def _context(width, height, surface_format):
+    key = (width, height, surface_format)
+    if key not in _CONTEXTS:
+        _CONTEXTS[key] = cairo.Context(cairo.ImageSurface(surface_format, width, height))
+    return _CONTEXTS[key]
+
+def _setup_pattern(config, seed, size, debug):
+    # Clear this process's context for the configured pattern, saving its state to be restored once drawn
+    width, height = size
+    # Patterns are greyscale so only need a single channel, the debug grids are drawn in colour
+    draw = _context(width, height, cairo.FORMAT_ARGB32 if debug else cairo.FORMAT_A8)
+    draw.save()
+
+    # Shapes replace what is beneath them, on an A8 surface drawing over would only ever brighten the alpha
+    draw.set_operator(cairo.OPERATOR_SOURCE)
+
+    # Black background by default, clearing the previous pattern
+    _set_grey(draw, 0)
+    draw.paint()
+
+    # Translate the context into [-1,1]x[-1,1]
+    draw.translate(width / 2.0, height / 2.0)
+    draw.scale(min(size) / 2.0, min(size) / 2.0)
+
+    # Every pattern gets its own generator from the same seed, so each output is the same whichever process draws it
+    if config['_fn'] in RANDOM_FUNCTIONS:
+        config['rng'] = _seed_rng(seed)
+    return draw
+
+def _render_one(n_config, seed, path, debug, size):
+    n, config = n_config
+    draw = _setup_pattern(config, seed, size, debug)
+    fn_name = config.pop('_fn')
+    REGISTERED_FUNCTIONS[fn_name](draw, **config)
+
+    if debug:
+        # Draw a red grid with resolution 0.1
+        for offset in _grid(0.1):
+            draw.move_to(-1, offset)
+            draw.line_to(1, offset)
+            draw.move_to(offset, -1)
+            draw.line_to(offset, 1)
+        draw.set_line_width(0.002)
+        draw.set_source_rgb(1, 0, 0)
+        draw.stroke()
+
+        # Draw a blue radial grid
+        for x_vec, y_vec in zip(*_unit_vectors(np.arange(32) * (tau / 32.0))):
+            draw.move_to(0.1 * x_vec, 0.1 * y_vec)
+            draw.line_to(x_vec, y_vec)
+        draw.set_source_rgb(0, 0, 1)
+        draw.stroke()
+
+    filename = '{:03}.{}.png'.format(n, fn_name)
+    if path:
+        filename = path_join(path, filename)
+
+    image = draw.get_target()
+    image.flush()
+    draw.restore()
+    # The PNG is encoded in the main process, leaving this one free to render its next pattern
+    return filename, (image.get_format(), *size, image.get_stride(), bytes(image.get_data()))
+
+def _write_png(filename, image):
+    surface_format, width, height, stride, data = image
+    cairo.ImageSurface.create_for_data(bytearray(data), surface_format, width, height, stride).write_to_png(filename)
+    return filename
+
 def main():
     args = parse_args()
 
     with open(args.config) as f:
         configs = json_load(f)
-
-    filenames = []
+    # Random patterns are seeded from --seed, a config can't substitute its own generator
     for n, config in enumerate(configs):
-        width, height = 1000, 1000
-        image = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
-        draw = cairo.Context(image)
-
-        # Black background by default
-        draw.rectangle(0, 0, width, height)
-        draw.set_source_rgb(0, 0, 0)
-        draw.fill()
-
-        # Translate the context into [-1,1]x[-1,1]
-        draw.translate(width / 2.0, height / 2.0)
-        draw.scale(min(width, height) / 2.0, min(width, height) / 2.0)
-
-        random_seed(args.seed)
-        fn_name = config.pop('_fn')
-        REGISTERED_FUNCTIONS[fn_name](draw, **config)
-
-        if args.debug:
-            # Draw a red grid with resolution 0.1
-            for offset in frange(-1, 1, 0.1):
-                draw.move_to(-1, offset)
-                draw.line_to(1, offset)
-                draw.move_to(offset, -1)
-                draw.line_to(offset, 1)
-            draw.set_line_width(0.002)
-            draw.set_source_rgb(1, 0, 0)
-            draw.stroke()
-
-            # Draw a blue radial grid
-            for angle in frange(0, tau, tau / 32.0):
-                draw.move_to(*polar_to_xy(0.1, angle))
-                draw.line_to(*polar_to_xy(1.0, angle))
-            draw.set_source_rgb(0, 0, 1)
-            draw.stroke()
-
-        filename = '{:03}.{}.png'.format(n, fn_name)
-        if args.path:
-            os_makedirs(args.path, exist_ok=True)
-            filename = path_join(args.path, filename)
-
-        image.flush()
-        image.write_to_png(filename)
-        filenames.append(filename)
+        if 'rng' in config:
+            raise ValueError('Config {} ({}) sets "rng", use --seed instead'.format(n, config.get('_fn')))
+
+    if args.path:
+        os_makedirs(args.path, exist_ok=True)
+
+    # Patterns are independent and seeded individually, so render them in parallel
+    size = (1000, 1000)
+    render = partial(_render_one, seed=args.seed, path=args.path, debug=args.debug, size=size)
+    # Each image is encoded on a background thread as soon as it arrives, and any failed write fails the run
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor, ThreadPoolExecutor() as png_writer:
+        writes = [png_writer.submit(_write_png, *rendered) for rendered in executor.map(render, enumerate(configs))]
+        filenames = [write.result() for write in writes]
+    for filename in filenames:
         LOG.debug('# %s', filename)
 
     return {
-        'dimensions': [width, height],
+        'dimensions': list(size),
         'outputs': filenames
     }
 
@@ -1,25 +1,44 @@
 #!/usr/bin/env python3
 # -*- coding: latin-1 -*-
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
-from json import dumps as json_dumps, load as json_load
+from json import dumps as json_dumps
 
 from pathlib import Path
 from collections import Counter, defaultdict
 
+# Optional module "orjson", parses the configs several times faster than the json module
+# PYPI: https://pypi.python.org/pypi/orjson
+# DOCS: https://github.com/ijl/orjson
+# Install with: pip3 install orjson
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 import logging
 LOG = logging.getLogger(__name__)
 
-def _iterate_references(node):
-    if isinstance(node, list):
-        for v in node:
-            yield from _iterate_references(v)
-    elif isinstance(node, dict):
-        node_type = node.get('type', None)
-        node_reference = node.get('reference', None)
-        if node_type and node_type == 'reference' and node_reference:
-            yield node_reference
-        for v in node.values():
-            yield from _iterate_references(v)
+def _iterate_references(root):
+    # Depth first with an explicit stack, the children pushed in reverse so the references come out in document order
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            # One pass over the items, picking out the type and reference and the children worth descending into
+            node_type = node_reference = None
+            children = []
+            for k, v in node.items():
+                if k == 'type':
+                    node_type = v
+                elif k == 'reference':
+                    node_reference = v
+                if isinstance(v, (list, dict)):
+                    children.append(v)
+            if node_type == 'reference' and node_reference:
+                yield node_reference
+            stack.extend(reversed(children))
 
 def parse_args():
     parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
@@ -59,29 +78,29 @@ def main():
     nodes_by_path = {}
     nodes_by_type = defaultdict(dict)
 
-    for path in Path(args.config).rglob('*.json'):
+    root = Path(args.config)
+    for path in root.rglob('*.json'):
         LOG.info('# Considering: %s', path)
-        with path.open() as f:
-            config = json_load(f)
-
-            # Extract the toplevel type of the node.
-            config_type = config.get('@configType', None)
-            if not config_type:
-                LOG.error('# Missing "@configType" from: %s', path)
-            else:
-                num_config_types[config_type] += 1
-
-                # Confirm the node is in the expected folder.
-                expected_path = config_type_to_location.get(config_type, None)
-                if not expected_path:
-                    LOG.error('# Unknown location for type "%s": %s', config_type, path)
-                elif expected_path != path.relative_to(args.config).parts[0]:
-                    LOG.error('# Move %s "%s" to "%s"', config_type, path, expected_path)
-                    bad_config_location[str(path)] = expected_path
-
-                nodes_by_path[path] = config
-                nodes_by_name[config['@name']] = config
-                nodes_by_type[config_type][path] = config
+        config = json_loads(path.read_bytes())
+
+        # Extract the toplevel type of the node.
+        config_type = config.get('@configType', None)
+        if not config_type:
+            LOG.error('# Missing "@configType" from: %s', path)
+        else:
+            num_config_types[config_type] += 1
+
+            # Confirm the node is in the expected folder.
+            expected_path = config_type_to_location.get(config_type, None)
+            if not expected_path:
+                LOG.error('# Unknown location for type "%s": %s', config_type, path)
+            elif expected_path != path.relative_to(root).parts[0]:
+                LOG.error('# Move %s "%s" to "%s"', config_type, path, expected_path)
+                bad_config_location[str(path)] = expected_path
+
+            nodes_by_path[path] = config
+            nodes_by_name[config['@name']] = config
+            nodes_by_type[config_type][path] = config
 
     # Collect the referenced nodes.
     referenced_nodes = {str(p): list(_iterate_references(c)) for p, c in nodes_by_path.items()}